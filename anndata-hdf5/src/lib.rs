@@ -8,9 +8,10 @@ use hdf5::{
     dataset::Dataset,
     types::IntSize::*,
     types::{FloatSize, TypeDescriptor, VarLenUnicode},
-    File, Group, H5Type, Location, Selection,
+    ByteOrder, File, FileBuilder, Group, H5Type, Location, Selection,
 };
 use ndarray::{Array, ArrayD, ArrayView, CowArray, Dimension, IxDyn, SliceInfo, SliceInfoElem};
+use std::cell::Cell;
 use std::ops::Deref;
 use std::ops::Index;
 use std::path::{Path, PathBuf};
@@ -63,18 +64,63 @@ impl Backend for H5 {
     type Dataset = H5Dataset;
 
     fn new<P: AsRef<Path>>(path: P) -> Result<Self::Store> {
-        Ok(H5File(File::create(path)?))
+        let mut builder = file_builder();
+        if IN_MEMORY.with(|x| x.get()) {
+            builder.with_fapl(|p| p.core_filebacked(false));
+        }
+        Ok(builder.create(path).map(H5File)?)
     }
 
     /// Opens a file as read-only, file must exist.
     fn open<P: AsRef<Path>>(path: P) -> Result<Self::Store> {
-        Ok(File::open(path).map(H5File)?)
+        Ok(file_builder().open(path).map(H5File)?)
     }
 
     /// Opens a file as read/write, file must exist.
     fn open_rw<P: AsRef<Path>>(path: P) -> Result<Self::Store> {
-        Ok(File::open_rw(path).map(H5File)?)
+        Ok(file_builder().open_rw(path).map(H5File)?)
+    }
+}
+
+thread_local! {
+    static CHUNK_CACHE_SIZE: Cell<Option<usize>> = Cell::new(None);
+    static IN_MEMORY: Cell<bool> = Cell::new(false);
+}
+
+/// File builder with the file access properties set for the current thread.
+fn file_builder() -> FileBuilder {
+    let mut builder = File::with_options();
+    if let Some(nbytes) = CHUNK_CACHE_SIZE.with(|x| x.get()) {
+        builder.with_fapl(|p| p.chunk_cache(chunk_cache_slots(nbytes), nbytes, 0.75));
     }
+    builder
+}
+
+/// Run `f` with files created on the current thread using the HDF5 core
+/// driver. These files live in memory only and are never written to disk,
+/// so they cannot be reopened by name once closed.
+pub fn with_in_memory_files<R>(f: impl FnOnce() -> R) -> R {
+    let prev = IN_MEMORY.with(|x| x.replace(true));
+    let result = f();
+    IN_MEMORY.with(|x| x.set(prev));
+    result
+}
+
+/// Run `f` with files opened on the current thread using a raw data chunk
+/// cache of `nbytes` bytes per dataset, instead of the HDF5 default of 1 MiB.
+/// A larger cache avoids decompressing the same chunk repeatedly when a
+/// dataset is read with many small selections.
+pub fn with_chunk_cache<R>(nbytes: usize, f: impl FnOnce() -> R) -> R {
+    let prev = CHUNK_CACHE_SIZE.with(|x| x.replace(Some(nbytes)));
+    let result = f();
+    CHUNK_CACHE_SIZE.with(|x| x.set(prev));
+    result
+}
+
+/// Number of hash table slots for a chunk cache of `nbytes` bytes: one per
+/// 8 KiB, but no fewer than the HDF5 default.
+fn chunk_cache_slots(nbytes: usize) -> usize {
+    (nbytes >> 13).max(521)
 }
 
 impl StoreOp<H5> for H5File {
@@ -257,6 +303,20 @@ impl DatasetOp<H5> for H5Dataset {
         Ok(Dataset::resize(self, shape.as_ref())?)
     }
 
+    fn byte_offset(&self) -> Option<u64> {
+        // Data stored in a non-native byte order cannot be used as is.
+        let native = match hdf5::Container::dtype(self).ok()?.byte_order() {
+            ByteOrder::LittleEndian => cfg!(target_endian = "little"),
+            ByteOrder::BigEndian => cfg!(target_endian = "big"),
+            _ => false,
+        };
+        if !native {
+            return None;
+        }
+        // Chunked, compact or unallocated datasets have no offset.
+        Dataset::offset(self)
+    }
+
     fn read_scalar<T: BackendData>(&self) -> Result<T> {
         let val = match T::DTYPE {
             ScalarType::Bool => self.deref().read_scalar::<bool>()?.into_dyn(),
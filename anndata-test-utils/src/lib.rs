@@ -178,10 +178,10 @@ pub fn test_concat<B: Backend>() {
             let adatas = [adata1, adata2];
 
             let out = AnnData::<B>::new(&output).unwrap();
-            concat::<_, _, String>(&adatas, JoinType::Inner, None, None, &out).unwrap();
+            concat::<_, _, String>(&adatas, JoinType::Inner, None, None, false, &out).unwrap();
 
             let out = AnnData::<B>::new(&output).unwrap();
-            concat::<_, _, String>(&adatas, JoinType::Outer, None, None, &out).unwrap();
+            concat::<_, _, String>(&adatas, JoinType::Outer, None, None, false, &out).unwrap();
         })
     });
 }
\ No newline at end of file
@@ -13,11 +13,25 @@ use zarrs::{array::{data_type::DataType, Element}, array_subset::ArraySubset, st
 use zarrs::filesystem::FilesystemStore;
 use zarrs::group::Group;
 use zarrs::{array::ElementOwned, storage::ReadableWritableListableStorageTraits};
-use zarrs::array::codec::bytes_to_bytes::zstd::ZstdCodec;
+use zarrs::array::codec::bytes_to_bytes::{gzip::GzipCodec, zstd::ZstdCodec};
+use zarrs::array::codec::BytesToBytesCodecTraits;
 
 /// The Zarr backend.
 pub struct Zarr;
 
+/// Translate the compression setting of a `WriteConfig` into zarr codecs.
+/// `None` stores the chunks uncompressed.
+fn compression_codecs(
+    compression: Option<Compression>,
+) -> Result<Vec<Arc<dyn BytesToBytesCodecTraits>>> {
+    let codecs: Vec<Arc<dyn BytesToBytesCodecTraits>> = match compression {
+        None => Vec::new(),
+        Some(Compression::Gzip(lvl)) => vec![Arc::new(GzipCodec::new(lvl.into())?)],
+        Some(Compression::Zst(lvl)) => vec![Arc::new(ZstdCodec::new(lvl.into(), false))],
+    };
+    Ok(codecs)
+}
+
 #[derive(Clone)]
 pub struct ZarrStore {
     inner: Arc<dyn ReadableWritableListableStorageTraits>,
@@ -171,9 +185,7 @@ impl GroupOp<Zarr> for ZarrStore {
             chunk_size,
             fill,
         )
-        .bytes_to_bytes_codecs(vec![
-            Arc::new(ZstdCodec::new(7, false))
-        ])
+        .bytes_to_bytes_codecs(compression_codecs(config.compression)?)
         .build(self.inner.clone(), &path)?;
         array.store_metadata()?;
         Ok(ZarrDataset {
@@ -284,9 +296,7 @@ impl GroupOp<Zarr> for ZarrGroup {
             chunk_size,
             fill,
         )
-        .bytes_to_bytes_codecs(vec![
-            Arc::new(ZstdCodec::new(7, false))
-        ])
+        .bytes_to_bytes_codecs(compression_codecs(config.compression)?)
         .build(self.store.inner.clone(), path.to_str().unwrap())?;
         array.store_metadata()?;
         Ok(ZarrDataset {
@@ -664,6 +674,45 @@ mod tests {
         })
     }
 
+    #[test]
+    fn test_compression_codecs() -> Result<()> {
+        with_tmp_path(|path| {
+            let store = Zarr::new(&path)?;
+            let group = store.new_group("group")?;
+            let cases = [
+                ("raw", None, None),
+                ("gzip", Some(Compression::Gzip(5)), Some(("gzip", 5))),
+                ("zstd", Some(Compression::Zst(3)), Some(("zstd", 3))),
+            ];
+            for (name, compression, expected) in cases {
+                let config = WriteConfig {
+                    compression,
+                    ..Default::default()
+                };
+                let arr = Array::random((20, 50), Uniform::new(0, 100));
+                let dataset = group.new_array_dataset(name, arr.view().into(), config)?;
+                assert_eq!(arr, dataset.read_array::<i32, Ix2>()?);
+
+                let metadata: Value = serde_json::from_slice(&std::fs::read(
+                    path.join("group").join(name).join("zarr.json"),
+                )?)?;
+                let codecs = metadata["codecs"].as_array().unwrap();
+                let compressors: Vec<_> = codecs
+                    .iter()
+                    .filter(|c| c["name"] != "bytes")
+                    .map(|c| {
+                        (
+                            c["name"].as_str().unwrap(),
+                            c["configuration"]["level"].as_i64().unwrap(),
+                        )
+                    })
+                    .collect();
+                assert_eq!(compressors, expected.into_iter().collect::<Vec<_>>());
+            }
+            Ok(())
+        })
+    }
+
     #[test]
     fn test_write_slice() -> Result<()> {
         let store = Zarr::new("test_zarr")?;
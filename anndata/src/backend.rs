@@ -168,6 +168,13 @@ pub trait DatasetOp<B: Backend + ?Sized> {
 
     /// Optional methods
 
+    /// Returns the absolute byte offset of the raw data in the file, if the
+    /// dataset is stored as a single contiguous, unfiltered block in native
+    /// byte order.
+    fn byte_offset(&self) -> Option<u64> {
+        None
+    }
+
     fn read_dyn_array_slice<S>(&self, selection: &[S]) -> Result<DynArray>
     where
         S: AsRef<SelectInfoElem>
@@ -1,5 +1,5 @@
 use crate::backend::ScalarType;
-use crate::data::utils::{array_major_minor_index_default, cs_major_minor_index2};
+use crate::data::utils::{array_major_minor_index_default, cs_minor_remap};
 use crate::data::{DataFrameIndex, DynCsrMatrix};
 use crate::{AnnDataOp, ArrayElemOp};
 use anyhow::{ensure, Result};
@@ -19,11 +19,17 @@ pub enum JoinType {
     Outer,
 }
 
+/// Concatenate `adatas` along the observation axis and write the result to `out`.
+///
+/// If all inputs have the same `var_names`, the columns are not remapped and the
+/// arrays are stacked as they are. Set `assume_same_vars` to skip the comparison
+/// of `var_names` when the caller already knows they are identical.
 pub fn concat<A, O, S>(
     adatas: &[A],
     join: JoinType,
     label: Option<&str>,
     keys: Option<&[S]>,
+    assume_same_vars: bool,
     out: &O,
 ) -> Result<()>
 where
@@ -31,31 +37,56 @@ where
     O: AnnDataOp,
     S: ToString,
 {
-    // Concatenate var_names
-    let common_vars = adatas
-        .iter()
-        .map(|x| x.var_names().into_iter().collect::<IndexSet<_>>());
-    let common_vars: IndexSet<String> = match join {
-        JoinType::Inner => common_vars.reduce(|a, b| a.intersection(&b).cloned().collect()),
-        JoinType::Outer => common_vars.reduce(|a, b| a.union(&b).cloned().collect()),
-    }
-    .unwrap();
-    out.set_var_names(common_vars.iter().cloned().collect())?;
+    let var_names: Vec<DataFrameIndex> = adatas.iter().map(|x| x.var_names()).collect();
+    let same_vars = if assume_same_vars {
+        ensure!(
+            var_names.iter().map(|x| x.len()).all_equal(),
+            "assume_same_vars is set but the number of variables differs"
+        );
+        true
+    } else {
+        var_names.iter().all_equal()
+    };
+
+    // Concatenate var_names. `None` means all inputs share the same var_names.
+    let common_vars: Option<IndexSet<String>> = if same_vars {
+        out.set_var_names(var_names[0].clone())?;
+        None
+    } else {
+        let common_vars: IndexSet<String> = match join {
+            JoinType::Inner => var_names
+                .iter()
+                .map(|x| x.clone().into_iter().collect::<IndexSet<_>>())
+                .reduce(|a, b| a.intersection(&b).cloned().collect())
+                .unwrap(),
+            // The union is built in a single pass, keeping the order of first appearance.
+            JoinType::Outer => var_names
+                .iter()
+                .flat_map(|x| x.clone().into_iter())
+                .collect(),
+        };
+        out.set_var_names(common_vars.iter().cloned().collect())?;
+        Some(common_vars)
+    };
 
     // Concatenate vars
     {
         let df_var = adatas
             .iter()
-            .map(|adata| {
+            .zip(var_names.iter())
+            .map(|(adata, names)| {
                 let var = adata.read_var().unwrap();
-                let var_names = adata.var_names();
-                // Creating the series
-                let columns = var
-                    .get_columns()
-                    .iter()
-                    .map(|s| align_series(s, &var_names, &common_vars))
-                    .collect::<Result<Vec<_>>>()?;
-                Ok(DataFrame::new(columns)?)
+                if let Some(common_vars) = &common_vars {
+                    // Creating the series
+                    let columns = var
+                        .get_columns()
+                        .iter()
+                        .map(|s| align_series(s, names, common_vars))
+                        .collect::<Result<Vec<_>>>()?;
+                    Ok(DataFrame::new(columns)?)
+                } else {
+                    Ok(var)
+                }
             })
             .reduce(|a, b| {
                 let mut a = a?;
@@ -102,10 +133,9 @@ where
                 .flat_map(|x| x.x().dtype().and_then(|d| d.scalar_type()))
                 .next()
                 .unwrap();
-            let x_arr = adatas.iter().map(|adata| {
+            let x_arr = adatas.iter().zip(var_names.iter()).map(|(adata, names)| {
                 let n_obs = adata.n_obs();
                 let n_vars = adata.n_vars();
-                let var_names = adata.var_names();
 
                 macro_rules! fun {
                     ($variant:ident) => {
@@ -117,18 +147,15 @@ where
                     .x()
                     .get()
                     .unwrap()
-                    .map(|arr| {
-                        index_array(
+                    .map(|arr| match &common_vars {
+                        Some(common_vars) => index_array(
                             arr,
-                            &(0..adata.n_obs())
-                                .into_iter()
-                                .map(|x| Some(x))
-                                .collect::<Vec<_>>(),
                             &common_vars
                                 .iter()
-                                .map(|x| var_names.get_index(x))
+                                .map(|x| names.get_index(x))
                                 .collect::<Vec<_>>(),
-                        )
+                        ),
+                        None => arr,
                     })
                     .unwrap_or_else(|| crate::macros::dyn_match!(dtype, ScalarType, fun))
             });
@@ -230,36 +257,38 @@ fn align_series(
     Ok(new_series.into())
 }
 
-fn index_array(
-    arr: ArrayData,
-    row_indices: &[Option<usize>],
-    col_indices: &[Option<usize>],
-) -> ArrayData {
+/// Reorder the columns of `arr`. `col_indices[j]` is the column of `arr` that
+/// becomes the `j`-th column of the output, or `None` for an empty column.
+fn index_array(arr: ArrayData, col_indices: &[Option<usize>]) -> ArrayData {
     macro_rules! fun_array {
-        ($variant:ident, $value:expr) => {
+        ($variant:ident, $value:expr) => {{
+            let row_indices = (0..$value.shape()[0]).map(Some).collect::<Vec<_>>();
             array_major_minor_index_default(
-                row_indices,
+                &row_indices,
                 col_indices,
                 &$value.into_dimensionality().unwrap(),
             )
             .into()
-        };
+        }};
     }
 
     macro_rules! fun_csr {
         ($variant:ident, $value:expr) => {{
+            let mut mapping = vec![None; $value.ncols()];
+            col_indices
+                .iter()
+                .enumerate()
+                .for_each(|(new, old)| {
+                    if let Some(old) = old {
+                        mapping[*old] = Some(new);
+                    }
+                });
             let (offsets, indices, data) = $value.csr_data();
-            let (new_row_offsets, new_col_indices, new_data) = cs_major_minor_index2(
-                row_indices,
-                col_indices,
-                $value.ncols(),
-                offsets,
-                indices,
-                data,
-            );
+            let (new_row_offsets, new_col_indices, new_data) =
+                cs_minor_remap(&mapping, offsets, indices, data);
             let pattern = unsafe {
                 SparsityPattern::from_offset_and_indices_unchecked(
-                    row_indices.len(),
+                    $value.nrows(),
                     col_indices.len(),
                     new_row_offsets,
                     new_col_indices,
@@ -1,5 +1,5 @@
 use crate::{
-    backend::{AttributeOp, Backend, DataContainer, DataType, GroupOp},
+    backend::{AttributeOp, Backend, DataContainer, DataType, DatasetOp, GroupOp, StoreOp},
     data::index::VecVecIndex,
     data::*,
 };
@@ -18,6 +18,7 @@ use rayon::iter::{IndexedParallelIterator, IntoParallelRefIterator, ParallelIter
 use smallvec::SmallVec;
 use std::{
     ops::{Deref, DerefMut},
+    path::PathBuf,
     sync::Arc,
 };
 
@@ -475,6 +476,18 @@ impl<B: Backend> InnerArrayElem<B> {
         self.cache_enabled = false;
     }
 
+    /// Returns the file name and byte offset of the raw data if the array is
+    /// stored as a single contiguous, unfiltered block that can be memory-mapped.
+    pub fn raw_location(&self) -> Option<(PathBuf, u64)> {
+        match &self.container {
+            DataContainer::Dataset(dataset) => {
+                let offset = dataset.byte_offset()?;
+                Some((dataset.store().ok()?.filename(), offset))
+            }
+            _ => None,
+        }
+    }
+
     pub fn data(&mut self) -> Result<ArrayData> {
         match self.element.as_ref() {
             Some(data) => Ok(data.clone().try_into()?),
@@ -876,10 +889,12 @@ impl<B: Backend> InnerStackedArrayElem<B> {
             .transpose()
     }
 
+    /// Select from the stacked elements. The elements are usually backed by
+    /// different files, so their parts of the selection are read in parallel.
     pub fn select<D, S>(&self, selection: &[S]) -> Result<Option<D>>
     where
         D: TryFrom<ArrayData>,
-        S: AsRef<SelectInfoElem>,
+        S: AsRef<SelectInfoElem> + Sync,
         <D as TryFrom<ArrayData>>::Error: Into<anyhow::Error>,
     {
         let data = if self.is_none() {
@@ -888,7 +903,7 @@ impl<B: Backend> InnerStackedArrayElem<B> {
             let (indices, mapping) = self.index.split_select(selection.as_ref()[0].as_ref());
             let array: ArrayData = self
                 .elems
-                .iter()
+                .par_iter()
                 .enumerate()
                 .map(|(i, el)| {
                     if let Some(idx) = indices.get(&i) {
@@ -904,43 +919,6 @@ impl<B: Backend> InnerStackedArrayElem<B> {
                         el.inner().select(select.as_slice())
                     }
                 })
-                .process_results(|x| Stackable::vstack(x).unwrap())?;
-            if let Some(m) = mapping {
-                Some(
-                    array
-                        .select_axis(0, SelectInfoElem::from(reverse_mapping(m)))
-                        .try_into()
-                        .map_err(Into::into)?,
-                )
-            } else {
-                Some(array.try_into().map_err(Into::into)?)
-            }
-        };
-        Ok(data)
-    }
-
-    pub fn par_select<D, S>(&self, selection: &[S]) -> Result<Option<D>>
-    where
-        D: Into<ArrayData> + TryFrom<ArrayData> + ReadableArray + Clone,
-        S: AsRef<SelectInfoElem> + Sync,
-        <D as TryFrom<ArrayData>>::Error: Into<anyhow::Error>,
-    {
-        let data = if self.is_none() {
-            None
-        } else {
-            let (indices, mapping) = self.index.split_select(selection.as_ref()[0].as_ref());
-            let array: ArrayData = self
-                .elems
-                .par_iter()
-                .enumerate()
-                .flat_map(|(i, el)| {
-                    indices.get(&i).map(|idx| {
-                        let select: SmallVec<[_; 3]> = std::iter::once(idx)
-                            .chain(selection.as_ref()[1..].iter().map(|x| x.as_ref()))
-                            .collect();
-                        el.inner().select(select.as_slice())
-                    })
-                })
                 .collect::<Vec<_>>()
                 .into_iter()
                 .process_results(|x| Stackable::vstack(x).unwrap())?;
@@ -442,6 +442,26 @@ where
             from_csr_data::<T>(indptr.len() - 1, shape[1] as usize, indptr, indices, data)
                 .unwrap()
                 .select_axis(1, info[1].as_ref())
+        } else if let SelectInfoElem::Index(idx) = info[0].as_ref() {
+            match sparse::read_csr_rows_by_index::<B, T>(container, idx)? {
+                Some((indptr, indices, data, order)) => {
+                    let shape: Vec<u64> = container.as_group()?.get_attr("shape")?;
+                    let csr = from_csr_data::<T>(
+                        indptr.len() - 1,
+                        shape[1] as usize,
+                        indptr,
+                        indices,
+                        data,
+                    )?;
+                    match order {
+                        Some(order) => {
+                            csr.select(&[SelectInfoElem::from(order), info[1].as_ref().clone()])
+                        }
+                        None => csr.select_axis(1, info[1].as_ref()),
+                    }
+                }
+                None => read_csr(container)?.select(info),
+            }
         } else {
             read_csr(container)?.select(info)
         };
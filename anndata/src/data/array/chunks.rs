@@ -1,13 +1,14 @@
-use crate::backend::{Backend, DataContainer, GroupOp, AttributeOp, BackendData, ScalarType};
+use crate::backend::{Backend, DataContainer, DatasetOp, GroupOp, AttributeOp, BackendData, ScalarType};
 use crate::Selectable;
 use crate::data::{
     array::DynArray,
     ArrayData,
+    SelectInfoElem,
     array::utils::ExtendableDataset,
 };
 
 use anyhow::{bail, Result, Context};
-use ndarray::{Array, ArrayView1, ArrayD, RemoveAxis};
+use ndarray::{Array, ArrayView1, ArrayD, Ix1, RemoveAxis};
 use nalgebra_sparse::na::Scalar;
 use nalgebra_sparse::{CsrMatrix, CscMatrix};
 use super::{DynCsrMatrix, DynCscMatrix, DynCsrNonCanonical, CsrNonCanonical};
@@ -20,6 +21,87 @@ pub trait ArrayChunk: Selectable {
         G: GroupOp<B>;
 }
 
+/// Sparse indices and offsets are stored as i32 when both fit, which is also
+/// what scipy uses, and as i64 otherwise.
+enum IndexDataset<B: Backend> {
+    I32(ExtendableDataset<B, i32>),
+    I64(ExtendableDataset<B, i64>),
+}
+
+impl<B: Backend> IndexDataset<B> {
+    /// Create the dataset for indices in the range `0..bound`.
+    fn new<G: GroupOp<B>>(group: &G, name: &str, bound: usize) -> Result<Self> {
+        if i32::try_from(bound).is_ok() {
+            Ok(Self::I32(ExtendableDataset::with_capacity(group, name, 1000.into())?))
+        } else {
+            Ok(Self::I64(ExtendableDataset::with_capacity(group, name, 1000.into())?))
+        }
+    }
+
+    fn extend(&mut self, values: &[usize]) -> Result<()> {
+        match self {
+            Self::I32(x) => x.extend(0, ArrayView1::from(values).mapv(|v| v as i32).view()),
+            Self::I64(x) => x.extend(0, ArrayView1::from(values).mapv(|v| v as i64).view()),
+        }
+    }
+
+    /// Finish the dataset and write the offsets next to it with the same dtype.
+    /// The number of entries is only known at the end: if the offsets do not
+    /// fit in i32, indices already written as i32 are rewritten as i64.
+    fn finish<G: GroupOp<B>>(
+        self,
+        group: &G,
+        name: &str,
+        offsets_name: &str,
+        offsets: Vec<usize>,
+    ) -> Result<()> {
+        let fits_i32 = offsets.last().map_or(true, |x| i32::try_from(*x).is_ok());
+        let as_i32 = match self {
+            Self::I32(x) => {
+                let dataset = x.finish()?;
+                if !fits_i32 {
+                    // No rename is available, so copy to a temporary dataset and back.
+                    let tmp = format!("{}_i64", name);
+                    let dataset = copy_as_i64::<B, G, i32>(group, &dataset, &tmp)?;
+                    group.delete(name)?;
+                    copy_as_i64::<B, G, i64>(group, &dataset, name)?;
+                    group.delete(&tmp)?;
+                }
+                fits_i32
+            }
+            Self::I64(x) => {
+                x.finish()?;
+                false
+            }
+        };
+        let offsets: ArrayData = if as_i32 {
+            offsets.into_iter().map(|x| x as i32).collect::<Vec<_>>().into()
+        } else {
+            offsets.into_iter().map(|x| x as i64).collect::<Vec<_>>().into()
+        };
+        group.new_array_dataset(offsets_name, offsets, Default::default())?;
+        Ok(())
+    }
+}
+
+/// Copy a 1-dimensional integer dataset into a new i64 dataset, block by block.
+fn copy_as_i64<B, G, T>(group: &G, from: &B::Dataset, name: &str) -> Result<B::Dataset>
+where
+    B: Backend,
+    G: GroupOp<B>,
+    T: BackendData + Into<i64>,
+{
+    const BLOCK_SIZE: usize = 1 << 24;
+    let len = from.shape()[0];
+    let mut to: ExtendableDataset<B, i64> = ExtendableDataset::with_capacity(group, name, len.into())?;
+    for start in (0..len).step_by(BLOCK_SIZE) {
+        let end = (start + BLOCK_SIZE).min(len);
+        let block = from.read_array_slice::<T, _, Ix1>(&[SelectInfoElem::from(start..end)])?;
+        to.extend(0, block.mapv(|x| x.into()).view())?;
+    }
+    to.finish()
+}
+
 impl ArrayChunk for ArrayData {
     fn write_by_chunk<B, G, I>(iter: I, location: &G, name: &str) -> Result<DataContainer<B>>
     where
@@ -122,7 +204,7 @@ impl ArrayChunk for DynCsrMatrix {
 
 
 impl<T: BackendData> ArrayChunk for CsrMatrix<T> {
-    fn write_by_chunk<B, G, I>(mut iter: I, location: &G, name: &str) -> Result<DataContainer<B>>
+    fn write_by_chunk<B, G, I>(iter: I, location: &G, name: &str) -> Result<DataContainer<B>>
     where
         I: Iterator<Item = Self>,
         B: Backend,
@@ -136,10 +218,11 @@ impl<T: BackendData> ArrayChunk for CsrMatrix<T> {
         let mut data: ExtendableDataset<B, T> = ExtendableDataset::with_capacity(
             &group, "data", 1000.into(),
         )?;
-        let mut indices: ExtendableDataset<B, i64> = ExtendableDataset::with_capacity(
-            &group, "indices", 1000.into(),
+        let mut iter = iter.peekable();
+        let mut indices = IndexDataset::new(
+            &group, "indices", iter.peek().map_or(0, |x| x.ncols()),
         )?;
-        let mut indptr: Vec<i64> = Vec::new();
+        let mut indptr: Vec<usize> = Vec::new();
         let mut num_rows = 0;
         let mut num_cols: Option<usize> = None;
         let mut nnz = 0;
@@ -154,19 +237,18 @@ impl<T: BackendData> ArrayChunk for CsrMatrix<T> {
                 let (indptr_, indices_, data_) = csr.csr_data();
                 indptr_[..indptr_.len() - 1]
                     .iter()
-                    .for_each(|x| indptr.push(i64::try_from(*x).unwrap() + nnz));
-                nnz += *indptr_.last().unwrap_or(&0) as i64;
+                    .for_each(|x| indptr.push(*x + nnz));
+                nnz += *indptr_.last().unwrap_or(&0);
                 data.extend(0, ArrayView1::from_shape(data_.len(), data_)?)?;
-                indices.extend(0, ArrayView1::from_shape(indices_.len(), indices_)?.mapv(|x| i64::try_from(x).unwrap()).view())
+                indices.extend(indices_)
             } else {
                 bail!("All matrices must have the same number of columns");
             }
         })?;
 
-        indices.finish()?;
         data.finish()?;
         indptr.push(nnz);
-        group.new_array_dataset("indptr", indptr.into(), Default::default())?;
+        indices.finish(&group, "indices", "indptr", indptr)?;
         group.new_attr("shape", [num_rows as u64, num_cols.unwrap_or(0) as u64].as_slice())?;
         Ok(DataContainer::Group(group))
     }
@@ -198,7 +280,7 @@ impl ArrayChunk for DynCsrNonCanonical {
 }
 
 impl<T: BackendData> ArrayChunk for CsrNonCanonical<T> {
-    fn write_by_chunk<B, G, I>(mut iter: I, location: &G, name: &str) -> Result<DataContainer<B>>
+    fn write_by_chunk<B, G, I>(iter: I, location: &G, name: &str) -> Result<DataContainer<B>>
     where
         I: Iterator<Item = Self>,
         B: Backend,
@@ -212,10 +294,11 @@ impl<T: BackendData> ArrayChunk for CsrNonCanonical<T> {
         let mut data: ExtendableDataset<B, T> = ExtendableDataset::with_capacity(
             &group, "data", 1000.into(),
         )?;
-        let mut indices: ExtendableDataset<B, i64> = ExtendableDataset::with_capacity(
-            &group, "indices", 1000.into(),
+        let mut iter = iter.peekable();
+        let mut indices = IndexDataset::new(
+            &group, "indices", iter.peek().map_or(0, |x| x.ncols()),
         )?;
-        let mut indptr: Vec<i64> = Vec::new();
+        let mut indptr: Vec<usize> = Vec::new();
         let mut num_rows = 0;
         let mut num_cols: Option<usize> = None;
         let mut nnz = 0;
@@ -230,19 +313,18 @@ impl<T: BackendData> ArrayChunk for CsrNonCanonical<T> {
                 let (indptr_, indices_, data_) = csr.csr_data();
                 indptr_[..indptr_.len() - 1]
                     .iter()
-                    .for_each(|x| indptr.push(i64::try_from(*x).unwrap() + nnz));
-                nnz += *indptr_.last().unwrap_or(&0) as i64;
+                    .for_each(|x| indptr.push(*x + nnz));
+                nnz += *indptr_.last().unwrap_or(&0);
                 data.extend(0, ArrayView1::from_shape(data_.len(), data_)?)?;
-                indices.extend(0, ArrayView1::from_shape(indices_.len(), indices_)?.mapv(|x| i64::try_from(x).unwrap()).view())
+                indices.extend(indices_)
             } else {
                 bail!("All matrices must have the same number of columns");
             }
         })?;
 
-        indices.finish()?;
         data.finish()?;
         indptr.push(nnz);
-        group.new_array_dataset("indptr", indptr.into(), Default::default())?;
+        indices.finish(&group, "indices", "indptr", indptr)?;
         group.new_attr("shape", [num_rows as u64, num_cols.unwrap_or(0) as u64].as_slice())?;
         Ok(DataContainer::Group(group))
     }
@@ -197,25 +197,31 @@ impl<T: Clone> Selectable for CsrMatrix<T> {
 
 impl<T: Clone> Stackable for CsrMatrix<T> {
     fn vstack<I: Iterator<Item = Self>>(iter: I) -> Result<Self> {
-        fn vstack_csr<T: Clone>(this: CsrMatrix<T>, other: CsrMatrix<T>) -> CsrMatrix<T> {
-            let num_cols = this.ncols();
-            let num_rows = this.nrows() + other.nrows();
-            let nnz = this.nnz();
-            let (mut indptr, mut indices, mut data) = this.disassemble();
-            let (indptr2, indices2, data2) = other.csr_data();
-            indices.extend_from_slice(indices2);
-            data.extend_from_slice(data2);
-            indptr2.iter().skip(1).for_each(|&i| indptr.push(i + nnz));
-
-            let pattern = unsafe {
-                SparsityPattern::from_offset_and_indices_unchecked(
-                    num_rows, num_cols, indptr, indices,
-                )
-            };
-            CsrMatrix::try_from_pattern_and_values(pattern, data).unwrap()
+        let mats: Vec<_> = iter.collect();
+        if mats.is_empty() {
+            bail!("Cannot stack empty iterator");
         }
+        let num_cols = mats[0].ncols();
+        let num_rows: usize = mats.iter().map(|x| x.nrows()).sum();
+        let nnz: usize = mats.iter().map(|x| x.nnz()).sum();
+
+        // Allocate the output once and copy each block, shifting its row offsets.
+        let mut indptr = Vec::with_capacity(num_rows + 1);
+        let mut indices = Vec::with_capacity(nnz);
+        let mut data = Vec::with_capacity(nnz);
+        indptr.push(0);
+        mats.iter().for_each(|mat| {
+            let offset = indices.len();
+            let (indptr_, indices_, data_) = mat.csr_data();
+            indptr.extend(indptr_[1..].iter().map(|&i| i + offset));
+            indices.extend_from_slice(indices_);
+            data.extend_from_slice(data_);
+        });
 
-        Ok(iter.reduce(|acc, x| vstack_csr(acc, x)).unwrap())
+        let pattern = unsafe {
+            SparsityPattern::from_offset_and_indices_unchecked(num_rows, num_cols, indptr, indices)
+        };
+        Ok(CsrMatrix::try_from_pattern_and_values(pattern, data).unwrap())
     }
 }
 
@@ -388,6 +394,27 @@ impl<T: BackendData> ReadableArray for CsrMatrix<T> {
                 )
                 .unwrap()
                 .select_axis(1, info[1].as_ref())
+            } else if let SelectInfoElem::Index(idx) = info[0].as_ref() {
+                match read_csr_rows_by_index::<B, T>(container, idx)? {
+                    Some((indptr, indices, data, order)) => {
+                        let csr = CsrMatrix::try_from_csr_data(
+                            indptr.len() - 1,
+                            Self::get_shape(container)?[1],
+                            indptr,
+                            indices,
+                            data,
+                        )
+                        .map_err(|e| anyhow!("cannot read csr matrix: {}", e))?;
+                        match order {
+                            Some(order) => csr.select(&[
+                                SelectInfoElem::from(order),
+                                info[1].as_ref().clone(),
+                            ]),
+                            None => csr.select_axis(1, info[1].as_ref()),
+                        }
+                    }
+                    None => Self::read(container)?.select(info),
+                }
             } else {
                 Self::read(container)?.select(info)
             };
@@ -401,6 +428,68 @@ impl<T: BackendData> ReadableArray for CsrMatrix<T> {
     }
 }
 
+/// Read the rows in `idx` (unsorted, possibly repeated) by sorting the unique
+/// rows into runs of consecutive rows and issuing one read per run.
+/// Returns the `indptr`, `indices` and `data` of the sorted unique rows, and
+/// the row order that puts them back into the requested order (`None` if
+/// `idx` is already sorted and unique).
+/// Returns `None` when the rows cover more than half of the stored entries, in
+/// which case reading the whole matrix at once is cheaper.
+pub(crate) fn read_csr_rows_by_index<B: Backend, T: BackendData>(
+    container: &DataContainer<B>,
+    idx: &[usize],
+) -> Result<Option<(Vec<usize>, Vec<usize>, Vec<T>, Option<Vec<usize>>)>> {
+    let group = container.as_group()?;
+    let shape = CsrMatrix::<T>::get_shape(container)?;
+    let indptr: Vec<usize> = group.open_dataset("indptr")?.read_array_cast()?.to_vec();
+    if let Some(i) = idx.iter().find(|i| **i >= shape[0]) {
+        bail!("row index {} out of bounds for matrix with {} rows", i, shape[0]);
+    }
+
+    let mut rows = idx.to_vec();
+    rows.sort_unstable();
+    rows.dedup();
+    let mut runs: Vec<(usize, usize)> = Vec::new();
+    for r in rows.iter() {
+        match runs.last_mut() {
+            Some((_, end)) if *end == *r => *end += 1,
+            _ => runs.push((*r, *r + 1)),
+        }
+    }
+    let nnz: usize = runs.iter().map(|(s, e)| indptr[*e] - indptr[*s]).sum();
+    if 2 * nnz > indptr[shape[0]] {
+        return Ok(None);
+    }
+
+    let data_ds = group.open_dataset("data")?;
+    let indices_ds = group.open_dataset("indices")?;
+    let mut new_indptr = Vec::with_capacity(rows.len() + 1);
+    let mut data: Vec<T> = Vec::with_capacity(nnz);
+    let mut indices: Vec<usize> = Vec::with_capacity(nnz);
+    new_indptr.push(0);
+    for (start, end) in runs {
+        let (lo, hi) = (indptr[start], indptr[end]);
+        if lo < hi {
+            let slice = SelectInfoElem::from(lo..hi);
+            data.extend(data_ds.read_array_slice::<T, _, Ix1>(&[&slice])?);
+            indices.extend(indices_ds.read_array_slice_cast::<usize, Ix1, _>(&[&slice])?);
+        }
+        let offset = new_indptr[new_indptr.len() - 1];
+        new_indptr.extend(indptr[start + 1..=end].iter().map(|x| x - lo + offset));
+    }
+
+    let order = if rows.as_slice() == idx {
+        None
+    } else {
+        Some(
+            idx.iter()
+                .map(|i| rows.binary_search(i).unwrap())
+                .collect(),
+        )
+    };
+    Ok(Some((new_indptr, indices, data, order)))
+}
+
 impl<T: BackendData> WritableArray for &CsrMatrix<T> {}
 impl<T: BackendData> WritableArray for CsrMatrix<T> {}
 
@@ -488,6 +577,19 @@ mod csr_matrix_index_tests {
         assert_eq!(new_data.as_slice(), expected_csr.values());
     }
 
+    #[test]
+    fn test_vstack() {
+        let a = DMatrix::from_row_slice(2, 3, &[1, 0, 3, 0, 0, 0]);
+        let b = DMatrix::from_row_slice(1, 3, &[0, 5, 0]);
+        let c = DMatrix::from_row_slice(2, 3, &[7, 0, 0, 0, 8, 9]);
+        let expected = DMatrix::from_row_slice(5, 3, &[1, 0, 3, 0, 0, 0, 0, 5, 0, 7, 0, 0, 0, 8, 9]);
+        let stacked = CsrMatrix::vstack(
+            [CsrMatrix::from(&a), CsrMatrix::from(&b), CsrMatrix::from(&c)].into_iter(),
+        )
+        .unwrap();
+        assert_eq!(stacked, CsrMatrix::from(&expected));
+    }
+
     #[test]
     fn test_csr() {
         for _ in 0..100 {
@@ -3,5 +3,6 @@ mod csc;
 mod noncanonical;
 mod dynamic;
 
+pub(crate) use csr::read_csr_rows_by_index;
 pub use noncanonical::*;
 pub use dynamic::*;
\ No newline at end of file
@@ -609,23 +609,28 @@ impl<T: Clone> Selectable for CsrNonCanonical<T> {
 
 impl<T: Clone> Stackable for CsrNonCanonical<T> {
     fn vstack<I: Iterator<Item = Self>>(iter: I) -> Result<Self> {
-        fn vstack_csr<T: Clone>(
-            this: CsrNonCanonical<T>,
-            other: CsrNonCanonical<T>,
-        ) -> CsrNonCanonical<T> {
-            let num_cols = this.ncols();
-            let num_rows = this.nrows() + other.nrows();
-            let nnz = this.nnz();
-            let (mut indptr, mut indices, mut data) = this.disassemble();
-            let (indptr2, indices2, data2) = other.csr_data();
-            indices.extend_from_slice(indices2);
-            data.extend_from_slice(data2);
-            indptr2.iter().skip(1).for_each(|&i| indptr.push(i + nnz));
-
-            CsrNonCanonical::from_csr_data(num_rows, num_cols, indptr, indices, data)
+        let mats: Vec<_> = iter.collect();
+        if mats.is_empty() {
+            bail!("Cannot stack empty iterator");
         }
-
-        Ok(iter.reduce(|acc, x| vstack_csr(acc, x)).unwrap())
+        let num_cols = mats[0].ncols();
+        let num_rows: usize = mats.iter().map(|x| x.nrows()).sum();
+        let nnz: usize = mats.iter().map(|x| x.nnz()).sum();
+
+        // Allocate the output once and copy each block, shifting its row offsets.
+        let mut indptr = Vec::with_capacity(num_rows + 1);
+        let mut indices = Vec::with_capacity(nnz);
+        let mut data = Vec::with_capacity(nnz);
+        indptr.push(0);
+        mats.iter().for_each(|mat| {
+            let offset = indices.len();
+            let (indptr_, indices_, data_) = mat.csr_data();
+            indptr.extend(indptr_[1..].iter().map(|&i| i + offset));
+            indices.extend_from_slice(indices_);
+            data.extend_from_slice(data_);
+        });
+
+        Ok(CsrNonCanonical::from_csr_data(num_rows, num_cols, indptr, indices, data))
     }
 }
 
@@ -236,93 +236,40 @@ where
     (new_offsets, new_indices, new_values)
 }
 
-/// Like `cs_major_minor_index`, but allows for the addition of empty columns/rows.
-/// Empty columns/rows are added by setting the corresponding index to `None`.
-pub(crate) fn cs_major_minor_index2<T: Clone>(
-    major_idx: &[Option<usize>],
-    minor_idx: &[Option<usize>],
-    len_minor: usize,
+/// Move the minor indices (columns of csr_matrix, rows of csc_matrix) to new positions.
+/// - mapping: `mapping[j]` is the new position of minor index `j`, or `None` if it is dropped
+/// - offset: offsets (indptr)
+/// - indices: minor indices
+/// - data: values in the matrix
+///
+/// Each entry is translated in a single pass. Lanes only need to be re-sorted when
+/// the mapping does not preserve the order of the minor indices.
+pub(crate) fn cs_minor_remap<T: Clone>(
+    mapping: &[Option<usize>],
     offsets: &[usize],
     indices: &[usize],
     data: &[T],
-) -> (Vec<usize>, Vec<usize>, Vec<T>)
-{
-    let num_added_minors = minor_idx.iter().filter(|&j| j.is_none()).count();
-    let len_minor = len_minor + num_added_minors;
-
-    // Compute the occurrence of each minor index, as the same index can occur multiple times
-    let mut minor_idx_count = vec![0; len_minor];
-    minor_idx_count[(len_minor-num_added_minors) .. len_minor].fill(1);
-    minor_idx.iter().for_each(|j| {
-        if let Some(j) = j {
-            minor_idx_count[*j] += 1;
-        }
-    });
-
-    // Compute new offsets (this is the row/column pointer array for the new matrix)
-    let mut new_nnz = 0;
-    let new_offsets = std::iter::once(0)
-        .chain(major_idx.iter().map(|i| {
-            if let Some(i) = i {
-                (offsets[*i]..offsets[i + 1]).for_each(|jj| new_nnz += minor_idx_count[indices[jj]]);
-            } 
-            new_nnz
-        }))
-        .collect();
-
-    // Get the permutation that sorts the minor indices.
-    // col_order[k] gets the unsorted minor index of the k-th sorted minor index
-    let mut t = len_minor - num_added_minors;
-    let col_order: Vec<usize> = minor_idx
-        .iter()
-        .map(|i| {
-            if let Some(i) = i {
-                *i
-            } else {
-                let i = t;
-                t += 1;
-                i
+) -> (Vec<usize>, Vec<usize>, Vec<T>) {
+    let is_sorted = mapping.iter().flatten().tuple_windows().all(|(a, b)| a < b);
+
+    let mut new_offsets = Vec::with_capacity(offsets.len());
+    let mut new_indices = Vec::with_capacity(indices.len());
+    let mut new_values = Vec::with_capacity(data.len());
+    new_offsets.push(0);
+    offsets.iter().tuple_windows().for_each(|(&start, &end)| {
+        let new_start = new_indices.len();
+        (start..end).for_each(|jj| {
+            if let Some(j) = mapping[indices[jj]] {
+                new_indices.push(j);
+                new_values.push(data[jj].clone());
             }
-        })
-        .enumerate()
-        .sorted_by_key(|(_, k)| *k)
-        .map(|(j, _)| j)
-        .collect();
-
-    // Cumsum in-place to calculate the new index of each original index, assuming
-    // that the minor indices are already sorted.
-    // From the resultant vector: the index of each minor index j can be query by v[j-1].
-    // Note that v[j] - v[j-1] == 0 if j is not present in the selection.
-    (1..len_minor).for_each(|j| minor_idx_count[j] += minor_idx_count[j - 1]);
-
-    // populates indices/data entries for selected columns.
-    let mut new_indices = vec![0; new_nnz];
-    let mut new_values: Vec<T> = Vec::with_capacity(new_nnz);
-    let mut n = 0;
-
-    // iterate over the row indices
-    major_idx.iter().flatten().for_each(|&i| {
-        let new_start = n;
-        // iterate over the columns indices of the current row from the original matrix
-        (offsets[i]..offsets[i + 1]).for_each(|jj| {
-            let j = indices[jj]; // column index
-            let v = &data[jj]; // value
-
-            // we need to compute the new indices for the current row
-            let idx_offset = minor_idx_count[j];
-            let prev_offset = if j == 0 { 0 } else { minor_idx_count[j - 1] };
-            (prev_offset..idx_offset).for_each(|k| {
-                // Note we use col_order[k] to get the original index of the k-th sorted index
-                new_indices[n] = col_order[k];
-                new_values.push(v.clone());
-                n += 1;
-            });
         });
-
-        // Now we need to actually sort the indices and values of the current row
-        let mut permutation = permutation::sort(&new_indices[new_start..n]);
-        permutation.apply_slice_in_place(&mut new_indices[new_start..n]);
-        permutation.apply_slice_in_place(&mut new_values[new_start..n]);
+        if !is_sorted {
+            let mut permutation = permutation::sort(&new_indices[new_start..]);
+            permutation.apply_slice_in_place(&mut new_indices[new_start..]);
+            permutation.apply_slice_in_place(&mut new_values[new_start..]);
+        }
+        new_offsets.push(new_indices.len());
     });
 
     (new_offsets, new_indices, new_values)
@@ -25,7 +25,7 @@ impl std::cmp::PartialEq for Index {
             (Index::Intervals(a), Index::Intervals(b)) => a == b,
             (Index::List(a), Index::List(b)) => a == b,
             (Index::Range(a), Index::Range(b)) => a == b,
-            _ => self.iter().zip(other.iter()).all(|(a, b)| a == b),
+            _ => self.len() == other.len() && self.iter().zip(other.iter()).all(|(a, b)| a == b),
         }
     }
 }
@@ -491,6 +491,16 @@ mod tests {
         );
     }
 
+    #[test]
+    fn test_eq() {
+        let range: Index = (0..20).into();
+        let list: Index = (0..10).map(|i| i.to_string()).collect();
+        assert_ne!(range, list);
+        assert_ne!(list, range);
+        let list: Index = (0..20).map(|i| i.to_string()).collect();
+        assert_eq!(range, list);
+    }
+
     fn select_strat(n: usize) -> BoxedStrategy<SelectInfoElem> {
         if n == 0 {
             Just(Vec::new().into()).boxed()
@@ -9,10 +9,13 @@ pub use memory::PyAnnData;
 
 use anndata;
 use anndata::concat::JoinType;
+use anndata::data::DataFrameIndex;
 use anndata::Backend;
-use anndata_hdf5::H5;
-use anyhow::Result;
+use anndata_hdf5::{with_chunk_cache, H5};
+use anyhow::{bail, Result};
+use polars::prelude::{NamedFrom, Series};
 use pyo3::prelude::*;
+use pyo3_polars::PySeries;
 use std::{
     collections::HashMap,
     ops::Deref,
@@ -35,6 +38,16 @@ pub(crate) fn get_backend<P: AsRef<Path>>(filename: P, backend: Option<&str>) ->
     }
 }
 
+/// Convert an index to a `pyarrow.Array` of strings via a polars `Series`.
+pub(crate) fn index_to_arrow<'py>(
+    py: Python<'py>,
+    name: &str,
+    index: DataFrameIndex,
+) -> Result<Bound<'py, PyAny>> {
+    let series = Series::new(name.into(), index.into_vec());
+    Ok(PySeries(series).into_pyobject(py)?.call_method0("to_arrow")?)
+}
+
 /// Read `.h5ad`-formatted hdf5 file.
 ///
 /// Parameters
@@ -89,10 +102,14 @@ pub fn read<'py>(
 ///     If `'r+'`, the file is opened in read/write mode.
 ///     If `None`, the AnnData object is read into memory.
 /// backend: Literal['hdf5'] | None
+/// assume_same_vars: bool
+///     If true, all inputs are assumed to have the same `var_names` and the
+///     check is skipped. Inputs with the same `var_names` are stacked without
+///     remapping their columns.
 #[pyfunction]
 #[pyo3(
-    signature = (adatas, *, join="inner", label=None, keys=None, file=None, backend=None),
-    text_signature = "(adatas, *, join='inner', label=None, keys=None, file=None, backend=None)",
+    signature = (adatas, *, join="inner", label=None, keys=None, file=None, backend=None, assume_same_vars=false),
+    text_signature = "(adatas, *, join='inner', label=None, keys=None, file=None, backend=None, assume_same_vars=False)",
 )]
 pub fn concat<'py>(
     py: Python<'py>,
@@ -102,6 +119,7 @@ pub fn concat<'py>(
     keys: Option<Vec<String>>,
     file: Option<PathBuf>,
     backend: Option<&str>,
+    assume_same_vars: bool,
 ) -> Result<Bound<'py, PyAny>> {
     let join = match join {
         "inner" => JoinType::Inner,
@@ -144,9 +162,9 @@ pub fn concat<'py>(
                     let adatas: Vec<_> = adatas.iter().map(|x| x.inner_ref::<H5>()).collect();
                     let adatas: Vec<_> = adatas.iter().map(|x| x.deref()).collect();
                     match &out {
-                        T::H5(out) => anndata::concat::concat(&adatas, join, label, keys, out)?,
-                        T::Zarr(out) => anndata::concat::concat(&adatas, join, label, keys, out)?,
-                        T::Py(out) => anndata::concat::concat(&adatas, join, label, keys, out)?,
+                        T::H5(out) => anndata::concat::concat(&adatas, join, label, keys, assume_same_vars, out)?,
+                        T::Zarr(out) => anndata::concat::concat(&adatas, join, label, keys, assume_same_vars, out)?,
+                        T::Py(out) => anndata::concat::concat(&adatas, join, label, keys, assume_same_vars, out)?,
                     }
                 }
                 Zarr::NAME => {
@@ -157,9 +175,9 @@ pub fn concat<'py>(
                     let adatas: Vec<_> = adatas.iter().map(|x| x.inner_ref::<Zarr>()).collect();
                     let adatas: Vec<_> = adatas.iter().map(|x| x.deref()).collect();
                     match &out {
-                        T::H5(out) => anndata::concat::concat(&adatas, join, label, keys, out)?,
-                        T::Zarr(out) => anndata::concat::concat(&adatas, join, label, keys, out)?,
-                        T::Py(out) => anndata::concat::concat(&adatas, join, label, keys, out)?,
+                        T::H5(out) => anndata::concat::concat(&adatas, join, label, keys, assume_same_vars, out)?,
+                        T::Zarr(out) => anndata::concat::concat(&adatas, join, label, keys, assume_same_vars, out)?,
+                        T::Py(out) => anndata::concat::concat(&adatas, join, label, keys, assume_same_vars, out)?,
                     }
                 }
                 _ => todo!(),
@@ -170,9 +188,9 @@ pub fn concat<'py>(
                 .map(|x| x.extract::<PyAnnData>(py).unwrap())
                 .collect::<Vec<_>>();
             match &out {
-                T::H5(out) => anndata::concat::concat(&adatas, join, label, keys, out)?,
-                T::Zarr(out) => anndata::concat::concat(&adatas, join, label, keys, out)?,
-                T::Py(out) => anndata::concat::concat(&adatas, join, label, keys, out)?,
+                T::H5(out) => anndata::concat::concat(&adatas, join, label, keys, assume_same_vars, out)?,
+                T::Zarr(out) => anndata::concat::concat(&adatas, join, label, keys, assume_same_vars, out)?,
+                T::Py(out) => anndata::concat::concat(&adatas, join, label, keys, assume_same_vars, out)?,
             }
         }
     }
@@ -268,20 +286,25 @@ pub fn read_mtx<'py>(
 ///     "r": Read-only mode; "r+": can modify annotation file but not component anndata files.
 /// backend: Literal['hdf5', 'zarr']
 ///     Backend to use for reading the annotation file.
+/// rdcc_nbytes: int | None
+///     Size in bytes of the HDF5 chunk cache used for each dataset of the
+///     component anndata files. If `None`, the HDF5 default (1 MiB) is used.
+///     Only supported by the "hdf5" backend.
 ///
 /// Returns
 /// -------
 /// AnnDataSet
 #[pyfunction]
 #[pyo3(
-    signature = (filename, *, adata_files_update=None, mode="r+", backend=None),
-    text_signature = "(filename, *, adata_files_update=None, mode='r+', backend=None)",
+    signature = (filename, *, adata_files_update=None, mode="r+", backend=None, rdcc_nbytes=None),
+    text_signature = "(filename, *, adata_files_update=None, mode='r+', backend=None, rdcc_nbytes=None)",
 )]
 pub fn read_dataset(
     filename: PathBuf,
     adata_files_update: Option<LocationUpdate>,
     mode: &str,
     backend: Option<&str>,
+    rdcc_nbytes: Option<usize>,
 ) -> Result<AnnDataSet> {
     let adata_files_update = match adata_files_update {
         Some(LocationUpdate::Map(map)) => Some(Ok(map)),
@@ -296,9 +319,18 @@ pub fn read_dataset(
                 "r+" => H5::open_rw(filename)?,
                 _ => panic!("Unkown mode"),
             };
-            Ok(anndata::AnnDataSet::<H5>::open(file, adata_files_update)?.into())
+            let dataset = match rdcc_nbytes {
+                Some(nbytes) => with_chunk_cache(nbytes, || {
+                    anndata::AnnDataSet::<H5>::open(file, adata_files_update)
+                })?,
+                None => anndata::AnnDataSet::<H5>::open(file, adata_files_update)?,
+            };
+            Ok(dataset.into())
         }
         Zarr::NAME => {
+            if rdcc_nbytes.is_some() {
+                bail!("rdcc_nbytes is only supported by the hdf5 backend");
+            }
             let file = match mode {
                 "r" => Zarr::open(filename)?,
                 "r+" => Zarr::open_rw(filename)?,
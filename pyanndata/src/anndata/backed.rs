@@ -8,7 +8,7 @@ use anndata::container::Slot;
 use anndata::data::{DataFrameIndex, SelectInfoElem, SelectInfoElemBounds};
 use anndata::{self, ArrayElemOp, AxisArraysOp, Data, ElemCollectionOp, Selectable};
 use anndata::{AnnDataOp, ArrayData, Backend};
-use anndata_hdf5::H5;
+use anndata_hdf5::{with_in_memory_files, H5};
 use anndata_zarr::Zarr;
 use anyhow::{bail, Result};
 use downcast_rs::{impl_downcast, Downcast};
@@ -18,7 +18,7 @@ use std::collections::HashMap;
 use std::ops::Deref;
 use std::path::PathBuf;
 
-use super::get_backend;
+use super::{get_backend, index_to_arrow};
 
 /** An annotated data matrix.
 
@@ -50,6 +50,10 @@ use super::get_backend;
         Name of backing file.
     backend
         The backend to use. "hdf5" or "zarr" are supported.
+    driver
+        The HDF5 file driver. If "core", the file is kept in memory and never
+        written to disk, which is useful for short-lived objects such as those
+        in tests. Only supported by the "hdf5" backend.
 
     Note
     ----
@@ -184,10 +188,10 @@ impl AnnData {
     #[pyo3(
         signature = (
             *, filename, X=None, obs=None, var=None, obsm=None,
-            varm=None, uns=None, backend=None,
+            varm=None, uns=None, backend=None, driver=None,
         ),
         text_signature = "($self, *, filename, X=None, obs=None, var=None, obsm=None,
-            varm=None, uns=None, backend=None)"
+            varm=None, uns=None, backend=None, driver=None)"
     )]
     pub fn new(
         filename: PathBuf,
@@ -198,12 +202,18 @@ impl AnnData {
         varm: Option<HashMap<String, PyArrayData>>,
         uns: Option<HashMap<String, PyData>>,
         backend: Option<&str>,
+        driver: Option<&str>,
     ) -> Result<Self> {
         let backend = get_backend(&filename, backend);
-        let adata: AnnData = match backend {
-            H5::NAME => anndata::AnnData::<H5>::new(filename)?.into(),
-            Zarr::NAME => anndata::AnnData::<Zarr>::new(filename)?.into(),
-            backend => bail!("Unknown backend: {}", backend),
+        let adata: AnnData = match (backend, driver) {
+            (H5::NAME, None) => anndata::AnnData::<H5>::new(filename)?.into(),
+            (H5::NAME, Some("core")) => {
+                with_in_memory_files(|| anndata::AnnData::<H5>::new(filename))?.into()
+            }
+            (Zarr::NAME, None) => anndata::AnnData::<Zarr>::new(filename)?.into(),
+            (H5::NAME, Some(driver)) => bail!("Unknown HDF5 driver: {}", driver),
+            (Zarr::NAME, Some(_)) => bail!("The zarr backend does not support drivers"),
+            (backend, _) => bail!("Unknown backend: {}", backend),
         };
 
         if X.is_some() {
@@ -271,6 +281,16 @@ impl AnnData {
         self.0.set_obs_names(names)
     }
 
+    /// Names of observations as a `pyarrow.Array`.
+    ///
+    /// Returns
+    /// -------
+    /// pyarrow.Array
+    #[pyo3(text_signature = "($self)")]
+    pub fn obs_names_arrow<'py>(&self, py: Python<'py>) -> Result<Bound<'py, PyAny>> {
+        index_to_arrow(py, "obs_names", self.0.obs_names())
+    }
+
     #[pyo3(text_signature = "($self, names)")]
     fn obs_ix(&self, names: Bound<'_, PyAny>) -> Result<Vec<usize>> {
         self.0.obs_ix(names)
@@ -290,6 +310,16 @@ impl AnnData {
         self.0.set_var_names(names)
     }
 
+    /// Names of variables as a `pyarrow.Array`.
+    ///
+    /// Returns
+    /// -------
+    /// pyarrow.Array
+    #[pyo3(text_signature = "($self)")]
+    pub fn var_names_arrow<'py>(&self, py: Python<'py>) -> Result<Bound<'py, PyAny>> {
+        index_to_arrow(py, "var_names", self.0.var_names())
+    }
+
     #[pyo3(text_signature = "($self, names)")]
     fn var_ix(&self, names: Bound<'_, PyAny>) -> Result<Vec<usize>> {
         self.0.var_ix(names)
@@ -9,7 +9,7 @@ use anndata::data::{ArrayData, DataFrameIndex, SelectInfoElem, SelectInfoElemBou
 use anndata::{self, ArrayElemOp, Data, Selectable};
 use anndata::{AnnDataOp, Backend};
 use anndata::{AxisArraysOp, ElemCollectionOp};
-use anndata_hdf5::H5;
+use anndata_hdf5::{with_chunk_cache, H5};
 use anndata_zarr::Zarr;
 use anyhow::{bail, Result};
 use downcast_rs::{impl_downcast, Downcast};
@@ -19,7 +19,7 @@ use std::collections::HashMap;
 use std::path::PathBuf;
 
 use super::backed::StackedAnnData;
-use super::get_backend;
+use super::{get_backend, index_to_arrow};
 
 /** Similar to `AnnData`, `AnnDataSet` contains annotations of
     observations `obs` (`obsm`, `obsp`), variables `var` (`varm`, `varp`),
@@ -36,6 +36,11 @@ use super::get_backend;
         The column name in obs to store the keys
     backend: Literal['hdf5', 'zarr']
         The backend to use for the AnnDataSet object.
+    rdcc_nbytes: int | None
+        Size in bytes of the HDF5 chunk cache used for each dataset of the
+        component files given by path. Files of AnnData objects that are already
+        open are not affected. If `None`, the HDF5 default (1 MiB) is used.
+        Only supported by the "hdf5" backend.
 
     Note
     ----
@@ -142,21 +147,26 @@ pub enum AnnDataFile<'py> {
 #[pymethods]
 impl AnnDataSet {
     #[new]
-    #[pyo3(signature = (adatas, *, filename, add_key="sample", backend=None))]
+    #[pyo3(signature = (adatas, *, filename, add_key="sample", backend=None, rdcc_nbytes=None))]
     pub fn new(
         adatas: Vec<(String, AnnDataFile)>,
         filename: PathBuf,
         add_key: &str,
         backend: Option<&str>,
+        rdcc_nbytes: Option<usize>,
     ) -> Result<Self> {
         let backend = get_backend(&filename, backend);
         match backend {
             H5::NAME => {
+                let open = |path: PathBuf| match rdcc_nbytes {
+                    Some(nbytes) => with_chunk_cache(nbytes, || H5::open(path)),
+                    None => H5::open(path),
+                };
                 let anndatas = adatas.into_iter().map(|(key, data_file)| {
                     let adata = match data_file {
                         AnnDataFile::Data(data) => data.borrow().take_inner::<H5>().unwrap(),
                         AnnDataFile::Path(path) => {
-                            anndata::AnnData::open(H5::open(path).unwrap()).unwrap()
+                            anndata::AnnData::open(open(path).unwrap()).unwrap()
                         }
                     };
                     (key, adata)
@@ -164,6 +174,9 @@ impl AnnDataSet {
                 Ok(anndata::AnnDataSet::new(anndatas, filename, add_key)?.into())
             }
             Zarr::NAME => {
+                if rdcc_nbytes.is_some() {
+                    bail!("rdcc_nbytes is only supported by the hdf5 backend");
+                }
                 let anndatas = adatas.into_iter().map(|(key, data_file)| {
                     let adata = match data_file {
                         AnnDataFile::Data(data) => data.borrow().take_inner::<Zarr>().unwrap(),
@@ -223,6 +236,16 @@ impl AnnDataSet {
         self.0.set_obs_names(names)
     }
 
+    /// Names of observations as a `pyarrow.Array`.
+    ///
+    /// Returns
+    /// -------
+    /// pyarrow.Array
+    #[pyo3(text_signature = "($self)")]
+    pub fn obs_names_arrow<'py>(&self, py: Python<'py>) -> Result<Bound<'py, PyAny>> {
+        index_to_arrow(py, "obs_names", self.0.obs_names())
+    }
+
     #[pyo3(text_signature = "($self, names)")]
     fn obs_ix(&self, names: &Bound<'_, PyAny>) -> Result<Vec<usize>> {
         self.0.obs_ix(names)
@@ -242,6 +265,16 @@ impl AnnDataSet {
         self.0.set_var_names(names)
     }
 
+    /// Names of variables as a `pyarrow.Array`.
+    ///
+    /// Returns
+    /// -------
+    /// pyarrow.Array
+    #[pyo3(text_signature = "($self)")]
+    pub fn var_names_arrow<'py>(&self, py: Python<'py>) -> Result<Bound<'py, PyAny>> {
+        index_to_arrow(py, "var_names", self.0.var_names())
+    }
+
     #[pyo3(text_signature = "($self, names)")]
     fn var_ix(&self, names: Bound<'_, PyAny>) -> Result<Vec<usize>> {
         self.0.var_ix(names)
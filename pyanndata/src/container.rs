@@ -2,7 +2,9 @@ mod traits;
 
 use crate::data::{PyData, PyArrayData};
 
+use anndata::backend::ScalarType;
 use pyo3::prelude::*;
+use pyo3::types::{PyDict, PyTuple};
 use pyo3_polars::PySeries;
 use traits::{ElemTrait, ArrayElemTrait, DataFrameElemTrait, AxisArrayTrait};
 use anyhow::Result;
@@ -85,6 +87,58 @@ impl PyArrayElem {
         self.0.get(subscript)
     }
 
+    /// Return the array as a read-only `numpy.memmap`.
+    ///
+    /// Memory-mapping is only possible for dense arrays stored as a single
+    /// contiguous, uncompressed block in native byte order, e.g., HDF5 datasets
+    /// with contiguous layout.
+    /// Otherwise the array is read into memory, the same as `self[:]`.
+    ///
+    /// Returns
+    /// -------
+    /// np.memmap | np.ndarray | scipy.sparse.csr_matrix
+    #[pyo3(text_signature = "($self)")]
+    fn asarray_mmap<'py>(&self, py: Python<'py>) -> Result<Bound<'py, PyAny>> {
+        if let Some((filename, offset, ty)) = self.0.raw_location() {
+            let dtype = match ty {
+                ScalarType::I8 => "int8",
+                ScalarType::I16 => "int16",
+                ScalarType::I32 => "int32",
+                ScalarType::I64 => "int64",
+                ScalarType::U8 => "uint8",
+                ScalarType::U16 => "uint16",
+                ScalarType::U32 => "uint32",
+                ScalarType::U64 => "uint64",
+                ScalarType::F32 => "float32",
+                ScalarType::F64 => "float64",
+                ScalarType::Bool => "bool",
+                ScalarType::String => unreachable!(),
+            };
+            let kwargs = PyDict::new(py);
+            kwargs.set_item("dtype", dtype)?;
+            kwargs.set_item("mode", "r")?;
+            kwargs.set_item("offset", offset)?;
+            kwargs.set_item("shape", PyTuple::new(py, self.0.shape())?)?;
+            Ok(py.import("numpy")?.getattr("memmap")?.call((filename,), Some(&kwargs))?)
+        } else {
+            Ok(self.0.get(py.Ellipsis().bind(py))?.into_pyobject(py)?)
+        }
+    }
+
+    /// Sum over the rows of the matrix.
+    ///
+    /// The matrix is streamed in chunks of rows, so only a single chunk is held in
+    /// memory at a time. Integers are summed as 64-bit integers and booleans are counted.
+    ///
+    /// Returns
+    /// -------
+    /// np.ndarray
+    ///     A 1-dimensional array of length `n_cols`.
+    #[pyo3(text_signature = "($self)")]
+    fn colsum(&self) -> Result<PyArrayData> {
+        self.0.colsum()
+    }
+
     /// Return a chunk of the matrix with random indices.
     ///
     /// Parameters
@@ -1,11 +1,14 @@
 use std::ops::Deref;
+use std::path::PathBuf;
 
 use crate::data::{
     is_none_slice, to_select_info, PyArrayData, PyData,
 };
 
-use anndata::backend::DataType;
-use anndata::data::SelectInfoElem;
+use anndata::backend::{DataType, ScalarType};
+use anndata::data::{CsrNonCanonical, SelectInfoElem};
+use nalgebra_sparse::CscMatrix;
+use ndarray::{Array, Array1, ArrayD, Ix2};
 use anndata::{
     ArrayData, ArrayElem, AxisArrays, Backend,
     DataFrameElem, Elem, ElemCollection, StackedArrayElem, StackedDataFrame, StackedAxisArrays,
@@ -71,6 +74,9 @@ pub trait ArrayElemTrait: Send + Sync {
         seed: u64,
     ) -> Result<ArrayData>;
     fn chunked(&self, chunk_size: usize) -> PyChunkedArray;
+    /// File name, byte offset and dtype of the raw data, if it can be memory-mapped.
+    fn raw_location(&self) -> Option<(PathBuf, u64, ScalarType)>;
+    fn colsum(&self) -> Result<PyArrayData>;
 }
 
 impl<B: Backend + 'static> ArrayElemTrait for ArrayElem<B> {
@@ -118,6 +124,25 @@ impl<B: Backend + 'static> ArrayElemTrait for ArrayElem<B> {
     fn chunked(&self, chunk_size: usize) -> PyChunkedArray {
         self.chunked(chunk_size).into()
     }
+
+    fn raw_location(&self) -> Option<(PathBuf, u64, ScalarType)> {
+        let inner = self.inner();
+        match inner.dtype() {
+            DataType::Array(ty) if ty != ScalarType::String => inner
+                .raw_location()
+                .map(|(filename, offset)| (filename, offset, ty)),
+            _ => None,
+        }
+    }
+
+    fn colsum(&self) -> Result<PyArrayData> {
+        let ncols = match self.shape()[..] {
+            [_, ncols] => ncols,
+            _ => bail!("colsum requires a 2-dimensional array"),
+        };
+        let ty = self.inner().dtype().scalar_type();
+        colsum(self.chunked::<ArrayData>(COLSUM_CHUNK_SIZE), ty, ncols)
+    }
 }
 
 impl<B: Backend + 'static> ArrayElemTrait for StackedArrayElem<B> {
@@ -165,6 +190,111 @@ impl<B: Backend + 'static> ArrayElemTrait for StackedArrayElem<B> {
     fn chunked(&self, chunk_size: usize) -> PyChunkedArray {
         self.chunked(chunk_size).into()
     }
+
+    fn raw_location(&self) -> Option<(PathBuf, u64, ScalarType)> {
+        None
+    }
+
+    fn colsum(&self) -> Result<PyArrayData> {
+        let ncols = match self.shape()[..] {
+            [_, ncols] => ncols,
+            _ => bail!("colsum requires a 2-dimensional array"),
+        };
+        let ty = anndata::ArrayElemOp::dtype(self).and_then(|x| x.scalar_type());
+        colsum(self.chunked::<ArrayData>(COLSUM_CHUNK_SIZE), ty, ncols)
+    }
+}
+
+/// Number of rows read at a time when computing column sums.
+const COLSUM_CHUNK_SIZE: usize = 1000;
+
+/// Sum the columns of a matrix given as an iterator over row chunks, without
+/// holding more than one chunk in memory. Following numpy, integers are
+/// accumulated in 64 bits and booleans are counted.
+/// Column sum accumulator. Integer sums wrap on overflow, as numpy's do.
+trait Accumulator: Copy + Default {
+    fn add(&mut self, v: Self);
+}
+
+impl Accumulator for i64 {
+    fn add(&mut self, v: Self) {
+        *self = self.wrapping_add(v);
+    }
+}
+
+impl Accumulator for u64 {
+    fn add(&mut self, v: Self) {
+        *self = self.wrapping_add(v);
+    }
+}
+
+impl Accumulator for f32 {
+    fn add(&mut self, v: Self) {
+        *self += v;
+    }
+}
+
+impl Accumulator for f64 {
+    fn add(&mut self, v: Self) {
+        *self += v;
+    }
+}
+
+fn colsum<I>(chunks: I, ty: Option<ScalarType>, ncols: usize) -> Result<PyArrayData>
+where
+    I: Iterator<Item = (ArrayData, usize, usize)>,
+{
+    fn helper<T, A, I>(chunks: I, ncols: usize) -> Result<ArrayD<A>>
+    where
+        I: Iterator<Item = (ArrayData, usize, usize)>,
+        T: Copy + Into<A>,
+        A: Accumulator,
+        Array<T, Ix2>: TryFrom<ArrayData, Error = anyhow::Error>,
+        CsrNonCanonical<T>: TryFrom<ArrayData, Error = anyhow::Error>,
+        CscMatrix<T>: TryFrom<ArrayData, Error = anyhow::Error>,
+    {
+        let mut acc = vec![A::default(); ncols];
+        for (chunk, _, _) in chunks {
+            match chunk {
+                ArrayData::Array(_) => {
+                    let arr: Array<T, Ix2> = chunk.try_into()?;
+                    arr.rows().into_iter().for_each(|row| {
+                        acc.iter_mut().zip(row).for_each(|(a, v)| a.add((*v).into()))
+                    });
+                }
+                ArrayData::CsrMatrix(_) | ArrayData::CsrNonCanonical(_) => {
+                    let csr: CsrNonCanonical<T> = chunk.try_into()?;
+                    csr.col_indices()
+                        .iter()
+                        .zip(csr.values())
+                        .for_each(|(j, v)| acc[*j].add((*v).into()));
+                }
+                ArrayData::CscMatrix(_) => {
+                    let csc: CscMatrix<T> = chunk.try_into()?;
+                    csc.triplet_iter().for_each(|(_, j, v)| acc[j].add((*v).into()));
+                }
+                ArrayData::DataFrame(_) => bail!("cannot sum the columns of a dataframe"),
+            }
+        }
+        Ok(Array1::from(acc).into_dyn())
+    }
+
+    let ty = ty.context("cannot sum the columns of a dataframe")?;
+    let sums: ArrayData = match ty {
+        ScalarType::I8 => helper::<i8, i64, _>(chunks, ncols)?.into(),
+        ScalarType::I16 => helper::<i16, i64, _>(chunks, ncols)?.into(),
+        ScalarType::I32 => helper::<i32, i64, _>(chunks, ncols)?.into(),
+        ScalarType::I64 => helper::<i64, i64, _>(chunks, ncols)?.into(),
+        ScalarType::U8 => helper::<u8, u64, _>(chunks, ncols)?.into(),
+        ScalarType::U16 => helper::<u16, u64, _>(chunks, ncols)?.into(),
+        ScalarType::U32 => helper::<u32, u64, _>(chunks, ncols)?.into(),
+        ScalarType::U64 => helper::<u64, u64, _>(chunks, ncols)?.into(),
+        ScalarType::F32 => helper::<f32, f32, _>(chunks, ncols)?.into(),
+        ScalarType::F64 => helper::<f64, f64, _>(chunks, ncols)?.into(),
+        ScalarType::Bool => helper::<bool, i64, _>(chunks, ncols)?.into(),
+        ScalarType::String => bail!("cannot sum the columns of a string array"),
+    };
+    Ok(sums.into())
 }
 
 pub trait DataFrameElemTrait: Send + Sync {
@@ -28,11 +28,24 @@ pub fn to_select_elem(ob: &Bound<'_, PyAny>, length: usize) -> PyResult<SelectIn
         SelectInfoElem::full()
     } else if ob.is_instance_of::<pyo3::types::PyInt>() {
         ob.extract::<usize>()?.into()
+    } else if let Ok(arr) = ob.downcast::<numpy::PyArray1<i64>>() {
+        // Borrow the buffer of int64 index arrays instead of boxing every element.
+        arr.try_readonly()?
+            .as_array()
+            .iter()
+            .map(|i| usize::try_from(*i).map_err(|_| {
+                pyo3::exceptions::PyOverflowError::new_err("can't convert negative int to unsigned")
+            }))
+            .collect::<PyResult<Vec<usize>>>()?
+            .into()
     } else if isinstance_of_arr(ob)? && ob.getattr("dtype")?.getattr("name")?.extract::<&str>()? == "bool" {
         let arr = ob
             .extract::<numpy::PyReadonlyArray1<bool>>()?;
         if arr.len()? == length {
-            boolean_mask_to_indices(arr.as_array().into_iter().map(|x| *x)).into()
+            match arr.as_slice() {
+                Ok(mask) => packed_mask_to_indices(mask).into(),
+                Err(_) => boolean_mask_to_indices(arr.as_array().into_iter().map(|x| *x)).into(),
+            }
         } else {
             panic!("boolean mask dimension mismatched")
         }
@@ -62,4 +75,39 @@ where
     iter.enumerate()
         .filter_map(|(i, x)| if x { Some(i) } else { None })
         .collect()
-}
\ No newline at end of file
+}
+
+/// Convert a contiguous boolean mask to indices. The mask is packed into a
+/// 32-bit word per 32 elements, which the compiler vectorizes, and the set
+/// bits are then visited with `trailing_zeros`. Runs of `false` cost one
+/// comparison per word.
+fn packed_mask_to_indices(mask: &[bool]) -> Vec<usize> {
+    let mut indices = Vec::new();
+    mask.chunks(32).enumerate().for_each(|(i, chunk)| {
+        let mut bits = chunk
+            .iter()
+            .enumerate()
+            .fold(0u32, |acc, (j, x)| acc | ((*x as u32) << j));
+        while bits != 0 {
+            indices.push(i * 32 + bits.trailing_zeros() as usize);
+            bits &= bits - 1;
+        }
+    });
+    indices
+}
+
+#[cfg(test)]
+mod tests {
+    use super::*;
+
+    #[test]
+    fn test_packed_mask_to_indices() {
+        let mask: Vec<bool> = (0..1000).map(|i| i % 3 == 0 || i % 7 == 0).collect();
+        assert_eq!(
+            packed_mask_to_indices(&mask),
+            boolean_mask_to_indices(mask.iter().copied()),
+        );
+        assert!(packed_mask_to_indices(&[]).is_empty());
+        assert!(packed_mask_to_indices(&[false; 65]).is_empty());
+    }
+}
@@ -1,4 +1,4 @@
-from anndata_rs import AnnData, AnnDataSet, read
+from anndata_rs import AnnData, AnnDataSet, read, read_dataset
 
 import pytest
 import math
@@ -198,18 +198,54 @@ def test_create_anndataset(x1, x2, x3, tmp_path, backend):
     adata1 = AnnData(X=csr_matrix(x1), filename=h5ad(tmp_path), backend=backend)
     adata2 = AnnData(X=csr_matrix(x2), filename=h5ad(tmp_path), backend=backend)
     adata3 = AnnData(X=csr_matrix(x3), filename=h5ad(tmp_path), backend=backend)
+    filename = h5ad(tmp_path)
     dataset = AnnDataSet(
         adatas=[("1", adata1), ("2", adata2), ("3", adata3)],
-        filename=h5ad(tmp_path),
+        filename=filename,
         add_key="batch",
         backend=backend,
     )
     np.testing.assert_array_equal(merged, dataset.X[:].todense())
+    dataset.close()
+    if backend == "hdf5":
+        dataset = read_dataset(filename, backend=backend, rdcc_nbytes=64 << 20)
+    else:
+        with pytest.raises(RuntimeError, match="rdcc_nbytes"):
+            read_dataset(filename, backend=backend, rdcc_nbytes=64 << 20)
+        dataset = read_dataset(filename, backend=backend)
+    np.testing.assert_array_equal(merged, dataset.X[:].todense())
 
     # indexing
     x = dataset.X[:]
     np.testing.assert_array_equal(x[:, [1,2,3]].todense(), dataset.X[:, [1,2,3]].todense())
 
+@pytest.mark.parametrize("backend", ["hdf5", "zarr"])
+def test_anndataset_chunk_cache(tmp_path, backend):
+    x = np.arange(30).reshape(6, 5)
+    files = []
+    for _ in range(2):
+        files.append(h5ad(tmp_path))
+        AnnData(X=csr_matrix(x), filename=files[-1], backend=backend).close()
+    adatas = [(str(i), f) for i, f in enumerate(files)]
+
+    if backend == "hdf5":
+        dataset = AnnDataSet(adatas=adatas, filename=h5ad(tmp_path), backend=backend, rdcc_nbytes=8 << 20)
+        np.testing.assert_array_equal(dataset.X[:].todense(), np.concatenate([x, x]))
+        dataset.close()
+    else:
+        with pytest.raises(RuntimeError, match="rdcc_nbytes"):
+            AnnDataSet(adatas=adatas, filename=h5ad(tmp_path), backend=backend, rdcc_nbytes=8 << 20)
+
+def test_in_memory_driver(tmp_path):
+    x = np.arange(20).reshape(4, 5)
+    filename = h5ad(tmp_path)
+    adata = AnnData(X=csr_matrix(x), filename=filename, backend="hdf5", driver="core")
+    adata.obsm = dict(x=x)
+    np.testing.assert_array_equal(adata.X[:].todense(), x)
+    np.testing.assert_array_equal(adata.obsm["x"], x)
+    adata.close()
+    assert not Path(filename).exists()
+
 @pytest.mark.parametrize("backend", ["hdf5", "zarr"])
 def test_noncanonical_csr(tmp_path, backend):
     def assert_csr_equal(a, b):
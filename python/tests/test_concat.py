@@ -2,13 +2,15 @@ from anndata_rs import AnnData, read, concat
 
 import pytest
 import hdf5plugin
+import h5py
 import anndata as ad
 import numpy as np
 import pandas as pd
 import polars as pl
+import pyarrow as pa
 from pathlib import Path
 import uuid
-from scipy.sparse import csr_matrix, csc_matrix
+from scipy.sparse import csr_matrix, csc_matrix, random, vstack
 
 def h5ad(dir=Path("./")):
     dir.mkdir(exist_ok=True)
@@ -81,7 +83,9 @@ def test_concat(tmp_path, backend):
     merged = concat([adata1, adata2, adata3], join='outer', file=out)
     assert merged.obs_names == ["1", "2", "3", "1", "2", "3", "1", "2", "3", "4"]
     assert merged.var_names == ["a", "b", "c", "d", "e", "f"]
-    np.testing.assert_array_equal(merged.X[:], x_merged)
+    obs_names = merged.obs_names_arrow()
+    assert obs_names.equals(pa.array(["1", "2", "3", "1", "2", "3", "1", "2", "3", "4"], type=obs_names.type))
+    np.testing.assert_array_equal(merged.X.asarray_mmap(), x_merged)
 
     merged.close()
     if backend == "hdf5":
@@ -99,3 +103,71 @@ def test_concat(tmp_path, backend):
     assert merged.obs_names == ["1", "2", "3", "1", "2", "3", "1", "2", "3", "4"]
     assert merged.var_names == ["a", "b", "c", "d", "e", "f"]
     np.testing.assert_array_equal(merged.X[:].todense(), x_merged)
+
+    merged.close()
+    if backend == "hdf5":
+        with h5py.File(out, "r") as f:
+            assert f["X/indices"].dtype == np.int32
+            assert f["X/indptr"].dtype == np.int32
+
+@pytest.mark.parametrize("backend", ["hdf5", "zarr"])
+def test_concat_same_vars(tmp_path, backend):
+    xs = [random(n, 20, 0.2, format="csr", dtype=np.int64) for n in [13, 1, 40]]
+    adatas = []
+    for x in xs:
+        adata = AnnData(X=x, filename=h5ad(tmp_path), backend=backend)
+        adata.var_names = [str(i) for i in range(20)]
+        adatas.append(adata)
+    expected = vstack(xs).todense()
+
+    for assume_same_vars in [False, True]:
+        merged = concat(adatas, join="outer", file=h5ad(tmp_path), assume_same_vars=assume_same_vars)
+        assert merged.var_names == [str(i) for i in range(20)]
+        np.testing.assert_array_equal(merged.X[:].todense(), expected)
+        merged.close()
+
+@pytest.mark.parametrize("backend", ["hdf5", "zarr"])
+def test_concat_range_var_names(tmp_path, backend):
+    x1 = np.arange(60).reshape(3, 20)
+    x2 = np.arange(20).reshape(2, 10)
+    adata1 = AnnData(X=x1, filename=h5ad(tmp_path), backend=backend)
+    # var set without names gets a range index, "0" to "19".
+    adata1.var = pl.DataFrame({"v": list(range(20))})
+    assert adata1.var_names == [str(i) for i in range(20)]
+    adata2 = AnnData(X=x2, filename=h5ad(tmp_path), backend=backend)
+    adata2.var_names = [str(i) for i in range(10)]
+
+    merged = concat([adata1, adata2], join="inner", file=h5ad(tmp_path))
+    assert merged.var_names == [str(i) for i in range(10)]
+    np.testing.assert_array_equal(merged.X[:], np.concatenate([x1[:, :10], x2]))
+    merged.close()
+
+    merged = concat([adata1, adata2], join="outer", file=h5ad(tmp_path))
+    assert merged.var_names == [str(i) for i in range(20)]
+    np.testing.assert_array_equal(merged.X[:], np.concatenate([x1, np.pad(x2, ((0, 0), (0, 10)))]))
+    merged.close()
+
+def test_asarray_mmap(tmp_path):
+    x = np.arange(60, dtype=np.float32).reshape(12, 5)
+    out = h5ad(tmp_path)
+    # Written without compression or chunking, so X is stored contiguously.
+    ad.AnnData(X=x).write_h5ad(out)
+    adata = read(out, backed="r")
+    arr = adata.X.asarray_mmap()
+    assert isinstance(arr, np.memmap)
+    np.testing.assert_array_equal(arr, x)
+    adata.close()
+
+    # Big-endian data is read, not memory-mapped as native values.
+    out = h5ad(tmp_path)
+    ad.AnnData(X=x).write_h5ad(out)
+    with h5py.File(out, "r+") as f:
+        attrs = dict(f["X"].attrs)
+        del f["X"]
+        f.create_dataset("X", data=x.astype(">f4"))
+        f["X"].attrs.update(attrs)
+    adata = read(out, backed="r")
+    arr = adata.X.asarray_mmap()
+    assert not isinstance(arr, np.memmap)
+    np.testing.assert_array_equal(arr, x)
+    adata.close()
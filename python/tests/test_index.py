@@ -7,7 +7,7 @@ import polars as pl
 import numpy as np
 from pathlib import Path
 import uuid
-from scipy.sparse import csr_matrix
+from scipy.sparse import csr_matrix, random
 
 def h5ad(dir=Path("./")):
     dir.mkdir(exist_ok=True)
@@ -50,6 +50,17 @@ def test_index(x, ridx, cidx, mask, tmp_path, backend):
     np.testing.assert_array_equal(adata.obsm.el('x')[:, np.array(mask)].todense(), x[:, np.array(mask)])
     np.testing.assert_array_equal(adata.obsm.el('x')[:, pl.Series(mask)].todense(), x[:, np.array(mask)])
 
+@pytest.mark.parametrize("backend", ["hdf5", "zarr"])
+def test_index_csr_rows(tmp_path, backend):
+    x = random(1000, 50, 0.1, format="csr", dtype=np.float32, random_state=0)
+    adata = AnnData(X=x, filename=h5ad(tmp_path), backend=backend)
+    # Few rows, so they are read from disk in runs instead of all at once.
+    idx = [900, 3, 3, 500, 4, 2, 900, 999]
+    np.testing.assert_array_equal(adata.X[idx, :].todense(), x[idx].todense())
+    np.testing.assert_array_equal(adata.X[idx, [7, 1]].todense(), x[idx][:, [7, 1]].todense())
+    np.testing.assert_array_equal(adata.X[sorted(set(idx)), :].todense(), x[sorted(set(idx))].todense())
+    adata.close()
+
 @pytest.mark.parametrize("backend", ["hdf5", "zarr"])
 @given(
     x1 = arrays(np.int64, (15, 179)),
@@ -14,6 +14,31 @@ def h5ad(dir=Path("./")):
     dir.mkdir(exist_ok=True)
     return str(dir / Path(str(uuid.uuid4()) + ".h5ad"))
 
+def to_csr(x):
+    """Build a CSR matrix from the nonzeros of a dense array."""
+    rows, cols = np.nonzero(x)
+    indptr = np.zeros(x.shape[0] + 1, dtype=np.int64)
+    np.cumsum(np.bincount(rows, minlength=x.shape[0]), out=indptr[1:])
+    return csr_matrix((x[rows, cols], cols, indptr), shape=x.shape)
+
+def csr_colsum_into(m, out):
+    """Add the column sums of a CSR matrix to `out` without a dense temporary."""
+    # Integer scatter-add: exact, and wraps on overflow like scipy's sum.
+    np.add.at(out, m.indices, m.data)
+
+@pytest.fixture(scope="module")
+def subset_adata(tmp_path_factory):
+    """Backed AnnData objects shared across Hypothesis examples, one per backend."""
+    tmp_dir = tmp_path_factory.mktemp("subset")
+    cache = {}
+    def get(backend):
+        if backend not in cache:
+            cache[backend] = AnnData(filename=h5ad(tmp_dir), backend=backend)
+        return cache[backend]
+    yield get
+    for adata in cache.values():
+        adata.close()
+
 @pytest.mark.parametrize("backend", ["hdf5", "zarr"])
 @given(
     x = arrays(integer_dtypes(endianness='='), (47, 79)),
@@ -30,24 +55,32 @@ def h5ad(dir=Path("./")):
     phases=(Phase.explicit, Phase.reuse, Phase.generate, Phase.target),
     suppress_health_check = [HealthCheck.function_scoped_fixture],
 )
-def test_subset(x, obs, obsm, obsp, varm, varp, indices, indices2, tmp_path, backend):
+def test_subset(x, obs, obsm, obsp, varm, varp, indices, indices2, subset_adata, tmp_path, backend):
+    obs_arr = np.asarray(obs, dtype=np.int64)
+    idx_arr = np.asarray(indices, dtype=np.intp)
     ident = list(map(lambda x: str(x), range(len(obs))))
-    adata = AnnData(
-        X=x,
-        obs = dict(ident=ident, txt=obs),
-        obsm = dict(x=obsm, y=csr_matrix(obsm)),
-        varm = dict(x=varm, y=csr_matrix(varm)),
-        filename = h5ad(tmp_path),
-        backend=backend,
-    )
-    adata.obsp = dict(x=obsp, y=csr_matrix(obsp))
-    adata.varp = dict(x=varp, y=csr_matrix(varp))
-    adata.layers["raw"] = x
+    # The shapes are fixed, so the backing file is reused and overwritten.
+    adata = subset_adata(backend)
+    adata.X = x
+    adata.obs = dict(ident=ident, txt=obs)
+    adata.obsm = dict(x=obsm, y=to_csr(obsm))
+    adata.varm = dict(x=varm, y=to_csr(varm))
+    adata.obsp = dict(x=obsp, y=to_csr(obsp))
+    adata.varp = dict(x=varp, y=to_csr(varp))
+    adata.layers = dict(raw=x)
 
-    for adata_subset in [ adata.subset(indices, indices2, out=h5ad(tmp_path), inplace=False, backend=backend),
-                         adata.subset(indices, indices2, inplace=False)]:
+    # All backed stages write to the same output file, which is closed before
+    # the next stage recreates it.
+    out = h5ad(tmp_path)
+    def subsets(*select):
+        adata_subset = adata.subset(*select, out=out, inplace=False, backend=backend)
+        yield adata_subset
+        adata_subset.close()
+        yield adata.subset(*select, inplace=False)
+
+    for adata_subset in subsets(indices, indices2):
         np.testing.assert_array_equal(adata_subset.X[:], x[np.ix_(indices, indices2)])
-        np.testing.assert_array_equal(adata_subset.obs["txt"], np.array(list(obs[i] for i in indices)))
+        np.testing.assert_array_equal(adata_subset.obs["txt"], obs_arr[idx_arr])
         np.testing.assert_array_equal(adata_subset.obsm["x"], obsm[indices, :])
         np.testing.assert_array_equal(adata_subset.obsm["y"].todense(), obsm[indices, :])
         np.testing.assert_array_equal(adata_subset.obsp["x"], obsp[np.ix_(indices, indices)])
@@ -58,25 +91,47 @@ def test_subset(x, obs, obsm, obsp, varm, varp, indices, indices2, tmp_path, bac
         np.testing.assert_array_equal(adata_subset.varp["y"].todense(), varp[np.ix_(indices2, indices2)])
         np.testing.assert_array_equal(adata_subset.layers["raw"], x[np.ix_(indices, indices2)])
 
-    for adata_subset in [ adata.subset([str(x) for x in indices], out=h5ad(tmp_path), inplace=False, backend=backend),
-                         adata.subset([str(x) for x in indices], inplace=False) ]:
+    for adata_subset in subsets([str(x) for x in indices]):
         np.testing.assert_array_equal(adata_subset.X[:], x[indices, :])
-        np.testing.assert_array_equal(adata_subset.obs["txt"], np.array(list(obs[i] for i in indices)))
+        np.testing.assert_array_equal(adata_subset.obs["txt"], obs_arr[idx_arr])
         np.testing.assert_array_equal(adata_subset.obsm["x"], obsm[indices, :])
         np.testing.assert_array_equal(adata_subset.obsm["y"].todense(), obsm[indices, :])
         np.testing.assert_array_equal(adata_subset.layers["raw"], x[indices, :])
 
-    for adata_subset in [ adata.subset(pl.Series([str(x) for x in indices]), out=h5ad(tmp_path), inplace=False, backend=backend),
-                         adata.subset(pl.Series([str(x) for x in indices]), inplace=False) ]:
+    for adata_subset in subsets(pl.Series([str(x) for x in indices])):
         np.testing.assert_array_equal(adata_subset.X[:], x[indices, :])
         np.testing.assert_array_equal(adata_subset.layers["raw"], x[indices, :])
 
+    # In-place subsetting would shrink the shared object, so work on a copy.
+    adata = adata.copy(out, backend=backend)
     adata.subset(indices)
     np.testing.assert_array_equal(adata.X[:], x[indices, :])
-    np.testing.assert_array_equal(adata.obs["txt"], np.array(list(obs[i] for i in indices)))
+    np.testing.assert_array_equal(adata.obs["txt"], obs_arr[idx_arr])
     np.testing.assert_array_equal(adata.obsm["x"], obsm[indices, :])
     np.testing.assert_array_equal(adata.obsm["y"].todense(), obsm[indices, :])
     np.testing.assert_array_equal(adata_subset.layers["raw"], x[indices, :])
+    adata.close()
+
+@pytest.mark.parametrize("backend", ["hdf5", "zarr"])
+def test_subset_mask(tmp_path, backend):
+    X = random(5000, 50, 0.1, format="csr", dtype=np.int64)
+    adata = AnnData(X=X, filename=h5ad(tmp_path), backend=backend)
+    idx = np.random.default_rng(0).integers(0, 2, 5000).astype(bool)
+    adata_subset = adata.subset(idx, inplace=False)
+    np.testing.assert_array_equal(adata_subset.X[:].todense(), X[idx].todense())
+    # Non-contiguous masks take the generic path.
+    idx = np.repeat(idx, 2)[::2]
+    adata_subset = adata.subset(idx, inplace=False)
+    np.testing.assert_array_equal(adata_subset.X[:].todense(), X[idx].todense())
+
+@pytest.mark.parametrize("backend", ["hdf5", "zarr"])
+def test_subset_negative_index(tmp_path, backend):
+    adata = AnnData(X=np.arange(20).reshape(5, 4), filename=h5ad(tmp_path), backend=backend)
+    with pytest.raises(OverflowError):
+        adata.X[[0, -1], :]
+    with pytest.raises(OverflowError):
+        adata.X[np.array([0, -1], dtype=np.int64), :]
+    adata.close()
 
 @pytest.mark.parametrize("backend", ["hdf5", "zarr"])
 def test_chunk(tmp_path, backend):
@@ -87,14 +142,15 @@ def test_chunk(tmp_path, backend):
         backend=backend,
     )
     s = X.sum(axis = 0)
-    s_ = np.zeros_like(s)
+    s_ = np.zeros(s.shape[1], dtype=s.dtype)
     for m, _, _ in adata.X.chunked(47):
-        s_ += m.sum(axis = 0)
-    np.testing.assert_array_equal(s, s_)
-    s_ = np.zeros_like(s)
+        csr_colsum_into(m, s_)
+    np.testing.assert_array_equal(s, s_[np.newaxis, :])
+    np.testing.assert_array_equal(s, adata.X.colsum()[np.newaxis, :])
+    s_ = np.zeros(s.shape[1], dtype=s.dtype)
     for m, _, _ in adata.X.chunked(500000):
-        s_ += m.sum(axis = 0)
-    np.testing.assert_array_equal(s, s_)
+        csr_colsum_into(m, s_)
+    np.testing.assert_array_equal(s, s_[np.newaxis, :])
 
     x1 = random(2321, 50, 0.1, format="csr", dtype=np.int64)
     x2 = random(2921, 50, 0.1, format="csr", dtype=np.int64)
@@ -111,14 +167,15 @@ def test_chunk(tmp_path, backend):
     )
 
     s = merged.sum(axis = 0)
-    s_ = np.zeros_like(s)
+    s_ = np.zeros(s.shape[1], dtype=s.dtype)
     for m, _, _ in adata.X.chunked(47):
-        s_ += m.sum(axis = 0)
-    np.testing.assert_array_equal(s, s_)
-    s_ = np.zeros_like(s)
+        csr_colsum_into(m, s_)
+    np.testing.assert_array_equal(s, s_[np.newaxis, :])
+    np.testing.assert_array_equal(s, adata.X.colsum()[np.newaxis, :])
+    s_ = np.zeros(s.shape[1], dtype=s.dtype)
     for m, _, _ in adata.X.chunked(500000):
-        s_ += m.sum(axis = 0)
-    np.testing.assert_array_equal(s, s_)
+        csr_colsum_into(m, s_)
+    np.testing.assert_array_equal(s, s_[np.newaxis, :])
 
 @pytest.mark.parametrize("backend", ["hdf5"])
 @given(
@@ -175,6 +232,7 @@ def test_anndataset_subset(x1, x2, x3, idx1, idx2, idx3, tmp_path, backend):
     shuffled_boolean_mask = list(i in s for i in range(dataset.n_obs))
 
     ## fancy indexing
+    np.testing.assert_array_equal(merged[indices, :], dataset.X[np.ascontiguousarray(indices, dtype=np.int64), :])
     dataset_subset, reorder = dataset.subset(indices, out=h5ad(tmp_path), backend=backend)
     assert reorder is None
     np.testing.assert_array_equal(merged[indices, :], dataset_subset.X[:])